@@ -1,254 +1,429 @@
 # Module to handle MQTT publish and subscribe methods
 import paho.mqtt.client as paho
+import paho.mqtt.publish as paho_publish
+from paho.mqtt import MQTTException
 import sys
 import time
 import logging
+import logging.handlers
 import os
+import socket
+import atexit
+import queue
+import threading
+from functools import cached_property
 from json_parser import JSON_Parser
 
 
-LOG_DIR = JSON_Parser().get_logging_logdir()
-LOG_LVL = getattr(logging, JSON_Parser().get_logging_level().upper())
+_CFG = JSON_Parser()
 
+LOG_DIR = _CFG.get_logging_logdir()
+LOG_LVL = getattr(logging, _CFG.get_logging_level().upper())
 
-logging.basicConfig(
-    filename=os.path.join(LOG_DIR, JSON_Parser().get_logging_filename()),
-    level = LOG_LVL
-)
+
+# Log records are queued by the calling thread and written to the log file by a background listener thread,
+# so the publish loop never blocks on disk I/O
+_LOG_Q = queue.Queue(-1)
+_file_handler = logging.FileHandler(os.path.join(LOG_DIR, _CFG.get_logging_filename()))
+_file_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_Q, _file_handler)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
+
+logging.root.addHandler(logging.handlers.QueueHandler(_LOG_Q))
+logging.root.setLevel(LOG_LVL)
 
 LOGGER = logging.getLogger(__name__)
 
+# The level comes from the config and is fixed for the life of the process, so check it once instead of on every call
+_DEBUG = LOGGER.isEnabledFor(logging.DEBUG)
+_INFO = LOGGER.isEnabledFor(logging.INFO)
+
+# Socket buffer sizes: publishers mostly send, subscribers mostly receive. 0 keeps the kernel default
+SOCK_SNDBUF = _CFG.get_socket_sndbuf()
+SOCK_RCVBUF = _CFG.get_socket_rcvbuf()
+
+# Received (topic, payload) pairs waiting to be printed by the subscriber worker thread
+_MSG_Q = queue.Queue(maxsize=10000)
+# Messages dropped because _MSG_Q was full; only the paho network thread updates it
+_DROPPED = 0
+
+# Upper bound in seconds for the reconnect backoff, used by paho's network thread and the publish loop
+MAX_BACKOFF = 30
+
+# In-flight window for QoS 1/2 publishes
+MAX_INFLIGHT = 1000
+
 def onMessage(client, userdata, msg):
-    print(msg.topic + ":" + msg.payload.decode())
+    # Runs on the paho network thread, so only hand the message off to the printer thread
+    global _DROPPED
+    try:
+        _MSG_Q.put_nowait((msg.topic, msg.payload))
+    except queue.Full:
+        # Count instead of logging every drop, so an overload does not also flood the log; disconnect() logs the total
+        _DROPPED += 1
+        if _DROPPED == 1:
+            LOGGER.warning("SUB : Message queue full, dropping messages")
+
+def _print_messages():
+    """
+    Drain _MSG_Q and write the received messages to stdout.
+
+    Writes are buffered and stdout is flushed only once the queue has been emptied, so bursts of messages cost a single flush.
+    Each message is marked done after it is handled, so _MSG_Q.join() returns once everything queued has been printed and flushed.
+    If stdout stops accepting writes (e.g. a closed pipe), the thread keeps draining and discards the messages,
+    so disconnect() never waits forever.
+    """
+    stdout_ok = True
+    while True:
+        topic, payload = _MSG_Q.get()
+        try:
+            if stdout_ok:
+                sys.stdout.write(topic + ":" + payload.decode("utf-8", "replace") + "\n")
+                if _MSG_Q.empty():
+                    sys.stdout.flush()
+        except OSError as e:
+            stdout_ok = False
+            LOGGER.warning("SUB : Could not write to stdout (%s), discarding received messages", e)
+        finally:
+            _MSG_Q.task_done()
+
+# The single printer thread draining _MSG_Q, started by the first subscriber
+_PRINTER = None
+
+def _get_printer():
+    """
+    Return the printer thread for _MSG_Q, starting it on first use so every subscriber shares one printer.
+    """
+    global _PRINTER
+    if _PRINTER is None:
+        _PRINTER = threading.Thread(target=_print_messages, daemon=True)
+        _PRINTER.start()
+    return _PRINTER
+
+def onSocketOpen(client, userdata, sock):
+    # Disable Nagle so small MQTT packets are sent immediately. paho calls this for every new socket, reconnects included
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+def onPubSocketOpen(client, userdata, sock):
+    onSocketOpen(client, userdata, sock)
+    if SOCK_SNDBUF:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCK_SNDBUF)
+
+def onSubSocketOpen(client, userdata, sock):
+    onSocketOpen(client, userdata, sock)
+    if SOCK_RCVBUF:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCK_RCVBUF)
+
+# Shared publisher clients keyed by the TLS flag, and the flags whose client is already connected
+_CLIENTS = {}
+_CONNECTED = set()
+
+# Per pooled client: messages handed to paho, and messages paho reported as published (acknowledged for QoS 1/2)
+_SENT = {}
+_PUBLISHED = {}
+
+def onPublish(client, userdata, mid):
+    # Runs on the paho network thread; userdata is the TLS flag of the pooled client
+    _PUBLISHED[userdata] += 1
+
+def _get_client(tls: bool):
+    """
+    Return the shared publisher client for plain or TLS connections, creating it on first use.
+
+    Every publisher in the process reuses one connection instead of repeating the TCP and TLS handshakes,
+    and the client is closed when the interpreter exits.
+    If mqtt_client_id is set in the config, the client uses it (with a "-TLS" suffix for TLS) and a persistent session
+    (clean_session=False), so later runs resume the same broker session. Otherwise paho picks a random id and the
+    session is clean, so no orphaned sessions are left on the broker.
+    """
+    if tls not in _CLIENTS:
+        client_id = _CFG.get_mqtt_client_id()
+        if client_id and tls:
+            client_id += "-TLS"
+        client = paho.Client(paho.CallbackAPIVersion.VERSION1, client_id=client_id, clean_session=not client_id, userdata=tls)
+        client.on_socket_open = onPubSocketOpen
+        client.on_publish = onPublish
+        _SENT[tls] = 0
+        _PUBLISHED[tls] = 0
+        client.max_inflight_messages_set(MAX_INFLIGHT)
+        # The paho network thread reconnects by itself after a dropped connection, backing off up to MAX_BACKOFF seconds
+        client.reconnect_delay_set(1, MAX_BACKOFF)
+        _CLIENTS[tls] = client
+        atexit.register(_close_client, tls)
+    return _CLIENTS[tls]
+
+def _retry_connect(connect, role):
+    """
+    Call connect until it succeeds, sleeping with exponential backoff (capped at MAX_BACKOFF seconds) between failed attempts.
+
+    Only transient failures are retried: refused or reset connections, the ConnectionError raised by the connect methods
+    and timeouts. Permanent errors such as an unresolvable host or a failed certificate verification propagate at once.
+    role is the "PUB"/"SUB" prefix used in the log messages.
+    """
+    backoff = 1
+    while True:
+        try:
+            return connect()
+        except (ConnectionError, TimeoutError) as e:
+            LOGGER.warning(role + " : Connection failed (%s), retrying in %d s", e, backoff)
+            time.sleep(backoff)
+            backoff = min(MAX_BACKOFF, backoff * 2)
+
+# SSL context shared by every TLS client, built on first use
+_TLS_CTX = None
+
+def _get_tls_context(ca_certs, certfile, keyfile):
+    """
+    Return the shared SSL context, loading the CA bundle and the certificate chain on first use.
+
+    The broker certificate chain is verified but the hostname is not, matching tls_insecure_set(True).
+    Sharing the context only saves re-reading the PEM files; every connection still does a full TLS handshake.
+    """
+    global _TLS_CTX
+    if _TLS_CTX is None:
+        # Keeps the non-TLS code free of a direct ssl dependency; paho.mqtt.client already imports ssl at load
+        import ssl
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ctx.check_hostname = False
+        ctx.load_verify_locations(ca_certs)
+        ctx.load_cert_chain(certfile, keyfile)
+        _TLS_CTX = ctx
+    return _TLS_CTX
+
+def _close_client(tls: bool):
+    """
+    Disconnect the shared publisher client, stop its network thread and drop it from the pool.
+    """
+    client = _CLIENTS.pop(tls, None)
+    _CONNECTED.discard(tls)
+    if client is not None:
+        client.disconnect()
+        client.loop_stop()
 
 class MQTTPublish:
     """
-    Class to handle MQTT publishing functionality.
+    Class to handle MQTT publishing functionality, over plain TCP or TLS.
 
     Attributes:
-        client: paho.mqtt.client.Client object for MQTT connection.
-        port: int, default port for MQTT connection.
+        tls: bool, whether the publisher connects over TLS.
+        client: paho.mqtt.client.Client object shared by all publishers of the same kind (plain or TLS) in the process.
+        port: int, port for MQTT connection, the TLS port if tls is set.
         timeout: int, timeout value for MQTT connection.
         host: str, host address for MQTT connection.
         topic: str, topic to publish messages to.
         message: str, message to publish.
+        message_bytes: bytes, UTF-8 encoded message sent on every publish.
         qos: int, quality of service level for message publishing.
-        start_time: float, timestamp when the publisher starts running.
+        ca_certs: str, path to the CA certificates for TLS, read on first access.
+        cafile: str, path to the certificate file for TLS, read on first access.
+        keyfile: str, path to the key file for TLS, read on first access.
+        batch_size: int, number of messages published per batch.
+        publish_rate: float, target messages per second, 0 for unpaced publishing.
+        start_time: float, monotonic timestamp when run() starts publishing, None before that.
 
     Methods:
         __init__: Constructor method to initialize MQTT client and attributes.
+        tls_config: Method to configure TLS settings for the MQTT client.
         connect: Method to establish connection with the MQTT broker.
         publish: Method to publish a message to the specified topic.
+        publish_many: Method to publish a fixed burst of payloads over a one-shot connection.
         run: Method to continuously publish messages until a certain time limit is reached.
         disconnect: Method to disconnect from the MQTT broker.
         start_loop: Method to start the MQTT publishing loop by connecting, publishing, and running the loop.
     """
-    def __init__(self) -> None:
-        self.client = paho.Client(paho.CallbackAPIVersion.VERSION1)
+    def __init__(self, tls: bool = False) -> None:
+        self.tls = tls
+        self.client = _get_client(tls=self.tls)
+
+        self.port = _CFG.get_mqtt_tls_port() if self.tls else _CFG.get_mqtt_port()
+        self.timeout = _CFG.get_mqtt_timeout()
+        self.host = _CFG.get_mqtt_host()
+
+        self.topic = _CFG.get_msg_topic()
+        self.message = _CFG.get_msg_payload()
+        # Encode the payload once so publish() does not re-encode it for every message
+        self.message_bytes = self.message.encode("utf-8") if isinstance(self.message, str) else self.message
+        self.qos = _CFG.get_mqtt_qos()
+
+        self.batch_size = _CFG.get_msg_batch_size()
+        self.publish_rate = _CFG.get_msg_publish_rate()
+
+        self.start_time = None
 
-        self.port = JSON_Parser().get_mqtt_port()
-        self.timeout = JSON_Parser().get_mqtt_timeout()
-        self.host = JSON_Parser().get_mqtt_host()
+    # TLS parameters are read from the config only when a TLS path first needs them
+    @cached_property
+    def ca_certs(self):
+        return _CFG.get_tlsparams_cacerts()
 
-        self.topic = JSON_Parser().get_msg_topic()
-        self.message = JSON_Parser().get_msg_payload()
-        self.qos = JSON_Parser().get_mqtt_qos()
+    @cached_property
+    def cafile(self):
+        return _CFG.get_tlsparams_certfile()
 
-        self.start_time = time.time()
+    @cached_property
+    def keyfile(self):
+        return _CFG.get_tlsparams_keyfile()
+
+    def tls_config(self):
+        """
+        Configure TLS settings for the MQTT client.
+
+        Uses the shared SSL context holding the CA certificates, server certificate, and server key for TLS encryption.
+        The context has hostname checking disabled, so TLS insecure mode is set to True for non-verified connections.
+        """
+        self.client.tls_set_context(_get_tls_context(self.ca_certs, self.cafile, self.keyfile))
 
     def connect(self):
         """
         Method to establish connection with the MQTT broker.
 
         Connects to the MQTT broker using the specified host, port, and timeout values.
-        If the connection is successful, prints "Connection to client established!".
-        If the connection fails, prints "Could not connect to client!" and exits the program with exit code -1.
+        If the connection is successful, logs "Connection to client established!" and starts the paho network thread.
+        If the connection fails, logs "Could not connect to client!" and raises ConnectionError so the caller can retry.
         """
-        self.client_result = self.client.connect(host=self.host, port=self.port, keepalive=self.timeout)
-        if self.client_result != 0:
-            # print("Could not connect to client!")
+        rc = self.client.connect(host=self.host, port=self.port, keepalive=self.timeout)
+        if rc:
             LOGGER.error("PUB : Could not connect to client!")
-            sys.exit(-1)
+            raise ConnectionError(paho.error_string(rc))
 
-        elif self.client_result == 0:
-            # print("Connection to client established!")
+        if _INFO:
             LOGGER.info("PUB : Connection to client established!")
+        self.client.loop_start()
+        _CONNECTED.add(self.tls)
     
     def publish(self):
-        self.client.publish(self.topic, self.message, self.qos)
-    
-    def run(self):
         """
-        Method to continuously publish messages until a certain time limit is reached.
+        Publish the message without waiting for the broker acknowledgement.
 
-        This method runs a loop that continuously publishes messages to the specified topic with a 5-second interval between each message.
-        It checks if the elapsed time since the start of publishing exceeds 200 seconds, and if so, it disconnects the publisher and exits the loop.
-        If any exception occurs during the loop, it disconnects from the broker and stops the loop.
-
-        Returns:
-            None
+        Every message handed to paho is counted, and the network thread counts the ones it reports as published
+        (acknowledged for QoS 1 and 2) in onPublish, so acknowledgements are tracked without blocking here.
+        Raises ConnectionError if the client is not connected, so the caller can back off while paho reconnects.
         """
-        while True:
-            try:
-                print("Press CTRL+C to exit....")
-                LOGGER.debug("PUB : Running the publish loop")
-                self.publish()
-                LOGGER.debug("PUB : Published message to network")
-                time.sleep(5)
-
-                if (time.time() - self.start_time >= 200):
-                    # print("Disconnecting the publisher....")
-                    LOGGER.warning("PUB : Disconnecting from broker!")
-                    self.disconnect()
-                    break 
-            except:
-                # print("Disconnecting from broker!")
-                LOGGER.warning("PUB : Disconnecting from broker!")
-                self.disconnect()
+        info = self.client.publish(self.topic, self.message_bytes, self.qos)
+        # QoS 1/2 messages stay queued in paho without a connection and are resent after reconnecting, so count them too
+        if info.rc == paho.MQTT_ERR_SUCCESS or self.qos:
+            _SENT[self.tls] += 1
+        if info.rc == paho.MQTT_ERR_NO_CONN:
+            # QoS 0 messages are lost
+            raise ConnectionError(paho.error_string(info.rc))
     
-    def disconnect(self):
+    def publish_many(self, payloads):
         """
-        Method to disconnect from the MQTT broker.
+        Publish a fixed burst of payloads over a one-shot connection and disconnect.
 
-        Disconnects the client from the MQTT broker by calling the disconnect method of the MQTT client object.
-        Logs a message indicating successful disconnection from the network using the LOGGER object.
+        The whole list is handed to paho.mqtt.publish.multiple, which connects, writes every message in a single
+        network loop and disconnects cleanly. TLS publishers use the shared SSL context.
+        Suited to burst producers that do not need the shared connection.
+        paho.mqtt.publish.multiple builds its own client and offers no socket hook, so unlike the shared connection
+        this path does not set TCP_NODELAY or SO_SNDBUF.
 
-        Returns:
-            None
-        """
-        self.client.disconnect()
-        LOGGER.info("PUB : Disconnected from network!")
-    
-    def start_loop(self):
-        """
-        Method to start the MQTT publishing loop by connecting, subscribing, and running the loop.
-
-        This method first establishes a connection with the MQTT broker using the specified host, port, and timeout values.
-        Then, it subscribes to the specified topic for receiving messages.
-        Finally, it runs a loop that continuously listens for incoming messages until the program is manually terminated.
+        Parameters:
+            payloads: list of str or bytes payloads to publish to the topic.
 
         Returns:
             None
         """
-        self.connect()
-        self.run()
-
-class MQTTPublish_TLS:
-    """
-    Class for handling MQTT publishing over TLS.
-
-    Attributes:
-        client: MQTT client object for publishing messages.
-        port: Port number for MQTT connection.
-        timeout: Timeout value for MQTT connection.
-        host: Host address for MQTT connection.
-        topic: Topic to publish messages to.
-        message: Message payload to publish.
-        qos: Quality of Service level for publishing.
-        start_time: Start time of the publishing process.
-
-    Methods:
-        tls_config: Configure TLS settings for the MQTT client.
-        connect: Establish connection with the MQTT broker.
-        publish: Publish a message to the specified topic.
-        run: Continuously publish messages until a time limit is reached.
-        disconnect: Disconnect from the MQTT broker.
-        start_loop: Start the MQTT publishing loop by connecting, subscribing, and running the loop.
-    """
-    def __init__(self) -> None:
-        self.client = paho.Client(paho.CallbackAPIVersion.VERSION1)
-
-        self.port = JSON_Parser().get_mqtt_port()
-        self.timeout = JSON_Parser().get_mqtt_timeout()
-        self.host = JSON_Parser().get_mqtt_host()
-
-        self.topic = JSON_Parser().get_msg_topic()
-        self.message = JSON_Parser().get_msg_payload()
-        self.qos = JSON_Parser().get_mqtt_qos()
-
-        self.ca_certs = JSON_Parser().get_tlsparams_cacerts()
-        self.cafile = JSON_Parser().get_tlsparams_certfile()
-        self.keyfile = JSON_Parser().get_tlsparams_keyfile()
-
-        self.start_time = time.time() 
-
-    def tls_config(self):
-        """
-        Configure TLS settings for the MQTT client.
-
-        Sets the CA certificates, server certificate, and server key for TLS encryption.
-        Also sets TLS insecure mode to True for non-verified connections.
-        """
-        self.client.tls_set(ca_certs=self.ca_certs,
-                            certfile=self.cafile,
-                            keyfile=self.keyfile)
-        
-        self.client.tls_insecure_set(True)
-
-    def connect(self):
-        """
-        Establishes a connection with the MQTT broker using the specified host, port, and timeout values. 
-        Logs an error message and exits if the connection fails, otherwise logs a success message.
-        """
-        self.client_result = self.client.connect(host=self.host, port=8883, keepalive=self.timeout)
-        if self.client_result != 0:
-            # print("Could not connect to client!")
-            LOGGER.error("PUB : Could not connect to client!")
-            sys.exit(-1)
-
-        elif self.client_result == 0:
-            # print("Connection to client established!")
-            LOGGER.info("PUB : Connection to client established!")
-    
-    def publish(self):
-        self.client.publish(self.topic, self.message, self.qos)
+        msgs = [{"topic": self.topic, "payload": p, "qos": self.qos} for p in payloads]
+        tls = _get_tls_context(self.ca_certs, self.cafile, self.keyfile) if self.tls else None
+        paho_publish.multiple(msgs, hostname=self.host, port=self.port, keepalive=self.timeout, tls=tls)
+        if _INFO:
+            LOGGER.info("PUB : Published %d messages in one burst", len(msgs))
     
     def run(self):
         """
-        Continuously publishes messages until a time limit is reached.
+        Method to continuously publish messages until a certain time limit is reached.
 
-        Prints a message to prompt the user to exit by pressing CTRL+C.
-        Logs the process of running the publish loop and publishing a message to the network.
-        Sleeps for 5 seconds after each message publication.
-        If the time limit of 200 seconds is reached, logs a warning and disconnects from the broker.
-        In case of any exceptions, logs a warning and disconnects from the broker.
+        This method publishes messages to the specified topic in batches of batch_size over the shared connection.
+        If publish_rate is non-zero, batches are scheduled on a monotonic clock and the loop sleeps only until the next batch is due,
+        keeping the rate at publish_rate messages per second without accumulating sleep jitter.
+        It checks if the elapsed time since the start of publishing exceeds 200 seconds, and if so, it exits the loop and leaves the shared connection open.
+        If the connection is lost, paho's network thread reconnects by itself; meanwhile the loop logs a warning and stops publishing
+        for an exponentially growing backoff (capped at MAX_BACKOFF seconds), then keeps publishing.
+        On CTRL+C it disconnects from the broker and re-raises KeyboardInterrupt.
 
         Returns:
             None
         """
-        while True:
-            try:
-                print("Press CTRL+C to exit....")
-                LOGGER.debug("PUB : Running the publish loop")
-                self.publish()
-                LOGGER.debug("PUB : Published message to network")
-                time.sleep(5)
-
-                if (time.time() - self.start_time >= 200):
-                    # print("Disconnecting the publisher....")
-                    LOGGER.warning("PUB : Disconnecting from broker!")
-                    self.disconnect()
+        print("Press CTRL+C to exit....")
+        # The window starts here, so time spent retrying the connection in start_loop does not eat into it
+        self.start_time = time.monotonic()
+        deadline = self.start_time + 200
+        # Pace batches against a monotonic schedule so sleep overshoot is absorbed by the next batch instead of accumulating
+        interval = self.batch_size / self.publish_rate if self.publish_rate else 0
+        next_send = time.monotonic()
+        backoff = 1
+        try:
+            while True:
+                try:
+                    if _DEBUG:
+                        LOGGER.debug("PUB : Running the publish loop")
+                    for _ in range(self.batch_size):
+                        self.publish()
+                    if _DEBUG:
+                        LOGGER.debug("PUB : Published message to network")
+                    if interval:
+                        next_send += interval
+                        delay = next_send - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                    backoff = 1
+                except (OSError, MQTTException) as e:
+                    # The paho network thread reconnects by itself, so only stop publishing into the dead connection for a while
+                    LOGGER.warning("PUB : Publish failed (%s), retrying in %d s", e, backoff)
+                    time.sleep(backoff)
+                    backoff = min(MAX_BACKOFF, backoff * 2)
+                    # Do not burst to catch up on the batches missed while reconnecting
+                    next_send = time.monotonic()
+
+                if time.monotonic() >= deadline:
+                    # The shared connection stays open for later publishers and is closed at exit
+                    LOGGER.warning("PUB : Publish window elapsed!")
                     break 
-            except:
-                # print("Disconnecting from broker!")
-                LOGGER.warning("PUB : Disconnecting from broker!")
-                self.disconnect()
+        except (KeyboardInterrupt, SystemExit):
+            # print("Disconnecting from broker!")
+            LOGGER.warning("PUB : Disconnecting from broker!")
+            self.disconnect()
+            raise
     
     def disconnect(self):
         """
-        Disconnects the MQTT client from the network.
+        Method to disconnect from the MQTT broker.
+
+        Disconnects the shared client from the MQTT broker, stops its network thread and removes it from the pool.
+        Logs a message indicating successful disconnection from the network using the LOGGER object.
 
-        Logs an 'INFO' message indicating successful disconnection from the network.
+        Returns:
+            None
         """
-        self.client.disconnect()
-        LOGGER.info("PUB : Disconnected from network!")
+        unpublished = _SENT.get(self.tls, 0) - _PUBLISHED.get(self.tls, 0)
+        if unpublished > 0:
+            LOGGER.warning("PUB : %d messages were not published or acknowledged before disconnecting", unpublished)
+        _close_client(tls=self.tls)
+        if _INFO:
+            LOGGER.info("PUB : Disconnected from network!")
     
     def start_loop(self):
         """
-        Starts the MQTT publishing loop by configuring TLS settings, establishing a connection with the MQTT broker, and running the message publishing loop continuously until a time limit is reached.
+        Method to start the MQTT publishing loop by connecting and running the loop.
+
+        This method fetches the shared client from the pool and, only if no earlier publisher has done so,
+        configures TLS (when tls is set) and connects it, retrying with backoff.
+        If connecting fails for good, the client is dropped from the pool before the error propagates.
+        Finally, it runs the publish loop until the time limit is reached.
+
+        Returns:
+            None
         """
-        self.tls_config()
-        self.connect()
+        self.client = _get_client(tls=self.tls)
+        if self.tls not in _CONNECTED:
+            try:
+                if self.tls:
+                    self.tls_config()
+                _retry_connect(self.connect, "PUB")
+            except BaseException:
+                # Drop the half-configured client so the next start_loop begins with a fresh one
+                _close_client(tls=self.tls)
+                raise
         self.run()
 
 class MQTTSubscribe:
@@ -257,6 +432,7 @@ class MQTTSubscribe:
 
     Attributes:
         client: paho.mqtt.client.Client object for MQTT connection.
+        printer: threading.Thread, daemon thread shared by all subscribers, printing received messages from the message queue.
         host: str, host address for MQTT connection.
         port: int, default port for MQTT connection.
         timeout: int, timeout value for MQTT connection.
@@ -274,15 +450,17 @@ class MQTTSubscribe:
     """
     def __init__(self) -> None:
         self.client = paho.Client(paho.CallbackAPIVersion.VERSION1)
+        self.client.on_socket_open = onSubSocketOpen
         self.client.on_message = onMessage
+        self.printer = _get_printer()
 
-        self.host = JSON_Parser().get_mqtt_host()
-        self.port = JSON_Parser().get_mqtt_port()
-        self.timeout = JSON_Parser().get_mqtt_timeout()
+        self.host = _CFG.get_mqtt_host()
+        self.port = _CFG.get_mqtt_port()
+        self.timeout = _CFG.get_mqtt_timeout()
 
-        self.topic = JSON_Parser().get_msg_topic()
-        self.message = JSON_Parser().get_msg_payload()
-        self.qos = JSON_Parser().get_mqtt_qos()
+        self.topic = _CFG.get_msg_topic()
+        self.message = _CFG.get_msg_payload()
+        self.qos = _CFG.get_mqtt_qos()
     
     # def tls_config(self):
     #     self.client.tls_set("C:\RV-COLLEGE-OF-ENGINEERING\Sixth Semester\CNP\EL\MQTT_protocol\code\certs\ca.crt")
@@ -292,16 +470,15 @@ class MQTTSubscribe:
         Method to establish connection with the MQTT broker.
 
         Connects to the MQTT broker using the specified host, port, and timeout values.
-        If the connection is successful, prints "Connection to client established!".
-        If the connection fails, prints "Could not connect to client!" and exits the program with exit code -1.
+        If the connection is successful, logs "Connection to client established!".
+        If the connection fails, logs "Could not connect to client!" and raises ConnectionError so the caller can retry.
         """
-        self.client_result = self.client.connect(host=self.host, port=self.port, keepalive=self.timeout)
-        if self.client_result != 0:
-            # print("Could not connect to client!")
+        rc = self.client.connect(host=self.host, port=self.port, keepalive=self.timeout)
+        if rc:
             LOGGER.error("SUB : Could not connect to client!")
-            sys.exit(-1)
-        elif self.client_result == 0:
-            # print("Connection to client established!")
+            raise ConnectionError(paho.error_string(rc))
+
+        if _INFO:
             LOGGER.info("SUB : Connection to client established!")
     
     def subscribe(self):
@@ -321,7 +498,8 @@ class MQTTSubscribe:
         try:
             print("Press CTRL+C to exit....")
             print(LOG_DIR)          # For debugging only
-            LOGGER.info("SUB : Subscriber waiting for packets")
+            if _INFO:
+                LOGGER.info("SUB : Subscriber waiting for packets")
             self.client.loop_forever()
         except:
             # print("Disconnecting from Broker")
@@ -333,19 +511,29 @@ class MQTTSubscribe:
         Method to disconnect from the MQTT broker.
 
         Disconnects the client from the MQTT broker by calling the disconnect method of the MQTT client object.
+        Then waits for the printer thread to print every message still queued and flushes stdout, so none are lost on exit,
+        and logs how many messages were dropped because the message queue was full.
         Logs a message indicating successful disconnection from the network using the LOGGER object.
 
         Returns:
             None
         """
         self.client.disconnect()
-        LOGGER.info("SUB : Disconnected from network!")
+        _MSG_Q.join()
+        try:
+            sys.stdout.flush()
+        except OSError:
+            pass
+        if _DROPPED:
+            LOGGER.warning("SUB : %d messages were dropped because the message queue was full", _DROPPED)
+        if _INFO:
+            LOGGER.info("SUB : Disconnected from network!")
     
     def start_loop(self):
         """
         Method to start the MQTT subscribing loop by connecting, subscribing, and running the loop.
 
-        This method first establishes a connection with the MQTT broker using the specified host, port, and timeout values.
+        This method first establishes a connection with the MQTT broker using the specified host, port, and timeout values, retrying with backoff until it succeeds.
         Then, it subscribes to the specified topic for receiving messages.
         Finally, it runs a loop that continuously listens for incoming messages until the program is manually terminated.
 
@@ -353,6 +541,6 @@ class MQTTSubscribe:
             None
         """
         # self.tls_config()
-        self.connect()
+        _retry_connect(self.connect, "SUB")
         self.subscribe()
         self.run()
\ No newline at end of file
@@ -15,11 +15,17 @@ class JSON_Parser:
 
     Methods:
         get_mqtt_port: Retrieve the MQTT port from the configuration.
+        get_mqtt_tls_port: Retrieve the MQTT port for TLS connections from the configuration, 8883 if not set.
+        get_mqtt_client_id: Retrieve the publisher client id from the configuration, empty if not set.
         get_mqtt_host: Retrieve the MQTT host from the configuration.
         get_mqtt_timeout: Retrieve the MQTT timeout from the configuration.
         get_mqtt_qos: Retrieve the MQTT quality of service from the configuration.
+        get_socket_sndbuf: Retrieve the publisher socket send buffer size in bytes from the configuration, 0 (kernel default) if not set.
+        get_socket_rcvbuf: Retrieve the subscriber socket receive buffer size in bytes from the configuration, 0 (kernel default) if not set.
         get_msg_topic: Retrieve the message topic from the configuration.
         get_msg_payload: Retrieve the message payload from the configuration.
+        get_msg_batch_size: Retrieve the number of messages published per batch from the configuration, 1 if not set.
+        get_msg_publish_rate: Retrieve the publish rate (messages per second, 0 for unpaced) from the configuration, 0.2 if not set.
         get_logging_logdir: Retrieve the logging directory from the configuration.
         get_logging_filename: Retrieve the logging filename from the configuration.
         get_logging_level: Retrieve the logging level from the configuration.
@@ -27,15 +33,26 @@ class JSON_Parser:
         get_tlsparams_certfile: Retrieve the certificate file path for TLS from the configuration.
         get_tlsparams_keyfile: Retrieve the key file path for TLS from the configuration.
     """
+    _json = None
+
     def __init__(self) -> None:
         self.filename = os.path.join(JSON_DIR, "config.json")
 
-        with open(self.filename, "r") as jsonfile:
-            self.json = json.load(jsonfile)
+        # Parse the config file only once per process and share it across instances
+        if JSON_Parser._json is None:
+            with open(self.filename, "r") as jsonfile:
+                JSON_Parser._json = json.load(jsonfile)
+        self.json = JSON_Parser._json
     
     def get_mqtt_port(self):
         return self.json["systemparams"]["mqtt_port"]
     
+    def get_mqtt_tls_port(self):
+        return self.json["systemparams"].get("mqtt_tls_port", 8883)
+    
+    def get_mqtt_client_id(self):
+        return self.json["systemparams"].get("mqtt_client_id", "")
+    
     def get_mqtt_host(self):
         return self.json["systemparams"]["mqtt_host"]
     
@@ -45,12 +62,24 @@ class JSON_Parser:
     def get_mqtt_qos(self):
         return self.json["systemparams"]["mqtt_qos"]
     
+    def get_socket_sndbuf(self):
+        return self.json["systemparams"].get("socket_sndbuf", 0)
+    
+    def get_socket_rcvbuf(self):
+        return self.json["systemparams"].get("socket_rcvbuf", 0)
+    
     def get_msg_topic(self):
         return self.json["messageparams"]["msg_topic"]
     
     def get_msg_payload(self):
         return self.json["messageparams"]["payload"]
     
+    def get_msg_batch_size(self):
+        return self.json["messageparams"].get("batch_size", 1)
+    
+    def get_msg_publish_rate(self):
+        return self.json["messageparams"].get("publish_rate", 0.2)
+    
     def get_logging_logdir(self):
         return self.json["logging"]["log_dir"]
     
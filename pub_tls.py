@@ -2,9 +2,9 @@ import MQTTHandlers
 
 def run_app():
     """
-    Run the application by creating an instance of MQTTPublish_TLS from MQTTHandlers module and starting the event loop.
+    Run the application by creating a TLS instance of MQTTPublish from MQTTHandlers module and starting the event loop.
 
-    This function initializes an MQTTPublish_TLS object and starts the event loop to publish messages using MQTT protocol.
+    This function initializes an MQTTPublish object with tls set and starts the event loop to publish messages using MQTT protocol.
 
     Parameters:
     None
@@ -12,7 +12,7 @@ def run_app():
     Returns:
     None
     """
-    publish_obj = MQTTHandlers.MQTTPublish_TLS()
+    publish_obj = MQTTHandlers.MQTTPublish(tls=True)
     publish_obj.start_loop()
 
 if __name__ == "__main__":